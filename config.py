@@ -2,3 +2,6 @@ YOUTUBE_CHANNEL_ID = ""
 MAX_VIDEO_LOOKBACK = 200
 YTDLP_EXECUTABLE='/root/youtube-live-transcript-archiver/.venv/bin/yt-dlp'
 TWITCHDOWNLOADER_EXECUTABLE = "/usr/bin/TwitchDownloaderCLI"
+# Codec for archived and cached Parquet files; zstd gives smaller files than
+# pyarrow's default snappy at the same write speed
+PARQUET_COMPRESSION = "zstd"
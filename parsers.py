@@ -3,12 +3,137 @@
 Module for parsing raw data files into structured Python objects.
 """
 
+import os
 import re
 import json
 import datetime
+import concurrent.futures
+import functools
+import itertools
+import mmap
+import numpy as np
 import pandas as pd
-import webvtt
-import io
+
+from config import PARQUET_COMPRESSION
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Inline timestamps like <00:00:00.000>, cue tags like <c> or <c.color>, and
+# bracketed annotations like [Music] or [&nbsp;__&nbsp;], removed in one pass
+_VTT_MARKUP_RE = re.compile(r"<(?:\d{2}:){2}\d{2}\.\d{3}>|</?\w*[^>]*>|\[[^\]]+\]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# WebVTT cue syntax, as accepted by webvtt-py: a timing line (optionally followed by
+# cue settings), the timestamps inside it, and tags within the cue text
+_CUE_TIMINGS_RE = re.compile(
+    r"\s*((?:\d+:)?\d{2}:\d{2}.\d{3})\s*-->\s*((?:\d+:)?\d{2}:\d{2}.\d{3})"
+)
+_CUE_TIMESTAMP_RE = re.compile(r"(?:(\d{1,2}):)?(\d{1,2}):(\d{1,2})\.(\d{3})")
+_CUE_TAG_RE = re.compile(r"<.*?>")
+
+# Chat text columns use Arrow-backed strings: one contiguous buffer per column
+# instead of a Python object per cell, and vectorized .str methods downstream
+_CHAT_STRING_DTYPE = "string[pyarrow]"
+_YOUTUBE_CHAT_STRING_COLUMNS = {
+    "author_name": _CHAT_STRING_DTYPE,
+    "message": _CHAT_STRING_DTYPE,
+    "superchat_amount": _CHAT_STRING_DTYPE,
+}
+_TWITCH_CHAT_STRING_COLUMNS = {
+    "author_name": _CHAT_STRING_DTYPE,
+    "message": _CHAT_STRING_DTYPE,
+    "user_color": _CHAT_STRING_DTYPE,
+    "created_at": _CHAT_STRING_DTYPE,
+}
+
+# Bump whenever a parser's output columns or dtypes change, so caches written by
+# an older version are ignored instead of served
+_PARQUET_CACHE_VERSION = 1
+
+# Live chat files at least this large per available CPU are parsed in parallel;
+# below it, process start-up and result pickling outweigh the JSON decoding saved
+_PARALLEL_CHAT_MIN_BYTES = 64 << 20
+
+
+def _join_message_runs(runs):
+    """
+    Joins the text of a chat message's runs; emoji runs carry no text.
+    """
+    # Most chat messages are a single plain-text run
+    if len(runs) == 1:
+        return runs[0].get("text", "").strip()
+    return "".join([part.get("text", "") for part in runs]).strip()
+
+
+def _format_offset_text(offset_seconds):
+    """
+    Formats non-negative offsets in seconds as human readable H:MM:SS strings.
+    Chat offsets repeat heavily, so only the distinct whole seconds are formatted.
+    """
+    whole_seconds = offset_seconds.to_numpy().astype(np.int64)
+    unique_seconds, inverse = np.unique(whole_seconds, return_inverse=True)
+    labels = np.array(
+        [str(datetime.timedelta(seconds=int(s))) for s in unique_seconds],
+        dtype=object,
+    )
+    return labels[inverse]
+
+
+def _parquet_cache_path(filepath: str) -> str:
+    """
+    Returns the Parquet parse cache path for a source file, tagged with the cache
+    version so results from an older parser are never loaded.
+    """
+    return f"{filepath}.v{_PARQUET_CACHE_VERSION}.parquet"
+
+
+def _with_parquet_cache(parse_func):
+    """
+    Adds an opt-in use_cache flag to a parser. When set, the parsed DataFrame is
+    saved as a Parquet file next to the source file and loaded from there on later
+    calls, for as long as it is newer than the source.
+    """
+
+    @functools.wraps(parse_func)
+    def wrapper(filepath, use_cache=False):
+        if not use_cache:
+            return parse_func(filepath)
+
+        cache_path = _parquet_cache_path(filepath)
+        try:
+            cache_is_fresh = os.path.getmtime(cache_path) >= os.path.getmtime(filepath)
+        except OSError:
+            # No cache yet; a missing source is reported by the parser itself
+            cache_is_fresh = False
+
+        if cache_is_fresh:
+            try:
+                print(f"Loading cached parse result: {cache_path}")
+                df = pd.read_parquet(cache_path)
+                # Parquet keeps the string type but not its storage; restore Arrow
+                string_columns = [
+                    col
+                    for col, dtype in df.dtypes.items()
+                    if isinstance(dtype, pd.StringDtype)
+                ]
+                return df.astype(dict.fromkeys(string_columns, _CHAT_STRING_DTYPE))
+            except Exception as e:
+                print(f"Error loading parse cache {cache_path}, re-parsing source: {e}")
+
+        df = parse_func(filepath)
+        if not df.empty:
+            try:
+                df.to_parquet(cache_path, compression=PARQUET_COMPRESSION)
+            except Exception as e:
+                print(f"Error saving parse cache to {cache_path}: {e}")
+        return df
+
+    return wrapper
 
 
 def _clean_subtitle_text(raw_text):
@@ -20,111 +145,186 @@ def _clean_subtitle_text(raw_text):
     if not raw_text:
         return ""
 
-    best_text_line = ""
-    # caption.text from webvtt-py can be a multi-line string
+    # Cue text can span multiple lines
     lines = raw_text.strip().split("\n")
 
-    for line_content in lines:
-        # Remove VTT inline timestamps like <00:00:00.000>
-        cleaned_line = re.sub(r"<(\d{2}:){2}\d{2}\.\d{3}>", "", line_content)
-        # Remove other VTT tags like <c> or <c.color>
-        cleaned_line = re.sub(r"<\/?\w*[^>]*>", "", cleaned_line)
-        # Remove bracketed annotations like [Music] or [&nbsp;__&nbsp;]
-        cleaned_line = re.sub(r"\[[^\]]+\]", "", cleaned_line)
-        # Replace &nbsp; with a space
-        cleaned_line = cleaned_line.replace("&nbsp;", " ")
+    # Later lines are often more complete, so scan from the end and stop at the
+    # first line that still has content after cleaning
+    for line_content in reversed(lines):
+        # Most auto-caption lines are plain text; only run the markup pass when needed
+        if "<" in line_content or "[" in line_content or "&nbsp;" in line_content:
+            line_content = _VTT_MARKUP_RE.sub("", line_content).replace("&nbsp;", " ")
         # Strip leading/trailing whitespace and normalize multiple spaces
-        cleaned_line = re.sub(r"\s+", " ", cleaned_line.strip())
+        cleaned_line = _WHITESPACE_RE.sub(" ", line_content.strip())
 
-        if cleaned_line:  # If this line has content after cleaning
-            best_text_line = (
-                cleaned_line  # Update, as later lines are often more complete
-            )
-    return best_text_line
+        if cleaned_line:
+            return cleaned_line
+    return ""
 
 
-def _consolidate_caption_df(df_initial):
+def _normalize_cue_timestamp(value):
     """
-    Cleans text and consolidates cues from an initial DataFrame.
+    Normalizes a cue timestamp like "01:02.500" or "1:01:02.500" to HH:MM:SS.mmm.
     """
-    if df_initial.empty:
-        return pd.DataFrame()
+    match = _CUE_TIMESTAMP_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid timestamp {value!r}")
+    hours, minutes, seconds, milliseconds = match.groups()
+    hours, minutes, seconds = int(hours or 0), int(minutes), int(seconds)
+    if minutes > 59 or seconds > 59:
+        raise ValueError(f"Invalid timestamp {value!r}")
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds}"
+
+
+def _iter_vtt_cues(vtt_content):
+    """
+    Yields (start, end, text) for each cue in WebVTT content, following the rules
+    webvtt-py applies: blocks are separated by blank lines, NOTE/STYLE and other
+    non-cue blocks are skipped, timestamps are normalized to HH:MM:SS.mmm and cue
+    tags are removed from the text.
+    Raises ValueError if the header or a timestamp is malformed.
+    """
+    lines = vtt_content.split("\n")
+    if not lines[0].startswith("WEBVTT"):
+        raise ValueError("Invalid format: missing WEBVTT header")
+
+    # Rolling captions reuse each timestamp as the next cue's start or end
+    normalized_timestamps = {}
+
+    def normalize(value):
+        normalized = normalized_timestamps.get(value)
+        if normalized is None:
+            normalized = normalized_timestamps[value] = _normalize_cue_timestamp(value)
+        return normalized
+
+    def is_timing(line):
+        return "-->" in line and _CUE_TIMINGS_RE.match(line) is not None
+
+    block = []
+    for line in itertools.chain(lines, [""]):
+        if line.strip():
+            block.append(line)
+            continue
+        if not block:
+            continue
+
+        # A cue block is a timing line followed by text, optionally after an identifier
+        if (
+            len(block) >= 2 and is_timing(block[0]) and "-->" not in block[1]
+        ) or (
+            len(block) >= 3
+            and "-->" not in block[0]
+            and is_timing(block[1])
+            and "-->" not in block[2]
+        ):
+            start = end = None
+            payload = []
+            for block_line in block:
+                timing_match = (
+                    _CUE_TIMINGS_RE.match(block_line) if "-->" in block_line else None
+                )
+                if timing_match:
+                    start, end = timing_match.groups()
+                elif start:
+                    payload.append(block_line)
 
-    # 1. Clean the text for each caption
-    df_initial["cleaned_text"] = df_initial["text"].apply(_clean_subtitle_text)
+            text = "\n".join(payload)
+            if "<" in text:
+                text = _CUE_TAG_RE.sub("", text)
+            yield normalize(start), normalize(end), text
 
-    # 2. Filter out rows that are empty after cleaning
-    df_processed = df_initial[df_initial["cleaned_text"] != ""].copy()
+        block = []
 
-    if df_processed.empty:
-        return pd.DataFrame()
 
-    # 3. Consolidate cues
-    consolidated_rows = []
+def _timestamps_to_seconds(timestamps):
+    """
+    Converts normalized "HH:MM:SS.mmm" cue timestamps to whole seconds, dropping
+    the milliseconds.
+    """
+    # View the fixed-width strings as a (n, 12) grid of code points, then as digits
+    code_points = np.array(timestamps, dtype="U12").view(np.uint32).reshape(-1, 12)
+    digits = code_points.astype(np.int64) - ord("0")
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 3] * 10 + digits[:, 4]
+    seconds = digits[:, 6] * 10 + digits[:, 7]
+    return hours * 3600 + minutes * 60 + seconds
 
-    # Initialize with the first valid cue
-    first_cue = df_processed.iloc[0]
-    consolidated_rows.append(
-        {
-            "start_time_str": first_cue["start_time_str"],
-            "end_time_str": first_cue["end_time_str"],
-            "start_seconds": first_cue["start_seconds"],
-            "end_seconds": first_cue["end_seconds"],
-            "text": first_cue["cleaned_text"],
-        }
-    )
 
-    for i in range(1, len(df_processed)):
-        current_row = df_processed.iloc[i]
-        last_consolidated = consolidated_rows[-1]
+def _consolidate_captions(start_strs, end_strs, start_secs, end_secs, texts):
+    """
+    Consolidates cleaned caption cues into a transcript DataFrame. The cues are
+    given as parallel sequences: timestamp strings and texts as lists, seconds
+    as numpy arrays.
+    """
+    # Each cue is compared against the row being built (whose text may already hold
+    # merged fragments), so this is a sequential scan. A consolidated row always
+    # starts at one cue and ends at a later one, so only those two cue indices and
+    # the merged text are recorded per row; there can never be more rows than cues.
+    # The scan compares plain Python numbers; the arrays are kept for the gather
+    start_list = start_secs.tolist()
+    end_list = end_secs.tolist()
+
+    n = len(texts)
+    first_cue = np.empty(n, dtype=np.intp)
+    last_cue = np.empty(n, dtype=np.intp)
+    out_texts = np.empty(n, dtype=object)
+
+    # Initialize with the first valid cue; k is the index of the row being built
+    k = 0
+    first_cue[0] = last_cue[0] = 0
+    out_texts[0] = texts[0]
+    # Plain Python copies of the row being built, for the comparisons below
+    last_start, last_end, last_text = start_list[0], end_list[0], texts[0]
+
+    for i in range(1, n):
+        text = texts[i]
+        start = start_list[i]
 
         # Scenario 1: Current text is a superstring of last, and starts at/near same time
         if (
-            current_row["cleaned_text"].startswith(last_consolidated["text"])
-            and len(current_row["cleaned_text"]) > len(last_consolidated["text"])
-            and abs(current_row["start_seconds"] - last_consolidated["start_seconds"])
-            < 0.5
+            text.startswith(last_text)
+            and len(text) > len(last_text)
+            and abs(start - last_start) < 0.5
         ):
-            last_consolidated["text"] = current_row["cleaned_text"]
-            last_consolidated["end_time_str"] = current_row["end_time_str"]
-            last_consolidated["end_seconds"] = current_row["end_seconds"]
+            last_text = out_texts[k] = text
+            last_cue[k] = i
+            last_end = end_list[i]
 
         # --- NEW LOGIC ---
         # Scenario 2: Merge very short subsequent lines if they are close in time
-        elif (
-            len(current_row["cleaned_text"].split()) < 3
-            and abs(current_row["start_seconds"] - last_consolidated["end_seconds"])
-            < 1.0
-        ):
+        elif len(text.split()) < 3 and abs(start - last_end) < 1.0:
             # Append the short text and update the end time
-            last_consolidated["text"] += f" {current_row['cleaned_text']}"
-            last_consolidated["end_time_str"] = current_row["end_time_str"]
-            last_consolidated["end_seconds"] = current_row["end_seconds"]
+            last_text = out_texts[k] = f"{last_text} {text}"
+            last_cue[k] = i
+            last_end = end_list[i]
         # -----------------
 
         # Scenario 3: New, distinct text or significant gap
         else:
-            if (
-                current_row["cleaned_text"] != last_consolidated["text"]
-                or abs(current_row["start_seconds"] - last_consolidated["end_seconds"])
-                >= 0.2
-            ):
-                consolidated_rows.append(
-                    {
-                        "start_time_str": current_row["start_time_str"],
-                        "end_time_str": current_row["end_time_str"],
-                        "start_seconds": current_row["start_seconds"],
-                        "end_seconds": current_row["end_seconds"],
-                        "text": current_row["cleaned_text"],
-                    }
-                )
+            if text != last_text or abs(start - last_end) >= 0.2:
+                k += 1
+                first_cue[k] = last_cue[k] = i
+                last_text = out_texts[k] = text
+                last_start, last_end = start, end_list[i]
             else:  # Similar text and time, likely a slight variation we can merge by extending
-                last_consolidated["end_time_str"] = current_row["end_time_str"]
-                last_consolidated["end_seconds"] = current_row["end_seconds"]
+                last_cue[k] = i
+                last_end = end_list[i]
 
-    return pd.DataFrame(consolidated_rows)
+    k += 1
+    first_cue = first_cue[:k]
+    last_cue = last_cue[:k]
+    return pd.DataFrame(
+        {
+            "start_time": np.asarray(start_strs, dtype=object)[first_cue],
+            "end_time": np.asarray(end_strs, dtype=object)[last_cue],
+            "offset_start_seconds": start_secs[first_cue],
+            "offset_end_seconds": end_secs[last_cue],
+            "text": out_texts[:k],
+        }
+    )
 
 
+@_with_parquet_cache
 def parse_transcript_vtt(filepath):
     """
     Parses a .vtt transcript file and returns a cleaned, consolidated DataFrame
@@ -132,193 +332,240 @@ def parse_transcript_vtt(filepath):
 
     Args:
         filepath (str): The path to the .vtt file.
+        use_cache (bool): Reuse a Parquet copy of the result saved next to the
+                          file, refreshing it when the file changes.
 
     Returns:
         pd.DataFrame: A DataFrame containing the transcript data.
                       Returns an empty DataFrame if parsing fails or file is empty.
     """
-    print(f"Parsing VTT transcript file with pandas-based logic: {filepath}")
+    print(f"Parsing VTT transcript file: {filepath}")
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            vtt_content = f.read()
-
-        # 1. Load initial captions into a list
-        captions_data = []
-        vtt_buffer = io.StringIO(vtt_content)
-        for caption in webvtt.read_buffer(vtt_buffer):
-            captions_data.append(
-                {
-                    "start_time_str": caption.start,
-                    "end_time_str": caption.end,
-                    "start_seconds": caption.start_in_seconds,
-                    "end_seconds": caption.end_in_seconds,
-                    "text": caption.text,
-                }
-            )
-
-        if not captions_data:
-            return pd.DataFrame()
-
-        df_initial = pd.DataFrame(captions_data)
+        # Decode straight from the mapped file rather than reading it into a bytes copy
+        with open(filepath, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                vtt_content = str(memoryview(mm), "utf-8")
+        # Same newline handling as text-mode reading
+        if "\r" in vtt_content:
+            vtt_content = vtt_content.replace("\r\n", "\n").replace("\r", "\n")
+
+        # 1. Clean captions as they are read, keeping only cues with text left.
+        # Rolling auto-captions repeat the same cue text across neighbouring cues,
+        # so each distinct text is cleaned once.
+        start_strs, end_strs, texts = [], [], []
+        cleaned_by_raw = {}
+        for start_str, end_str, raw_text in _iter_vtt_cues(vtt_content):
+            cleaned_text = cleaned_by_raw.get(raw_text)
+            if cleaned_text is None:
+                cleaned_text = cleaned_by_raw[raw_text] = _clean_subtitle_text(raw_text)
+            if not cleaned_text:
+                continue
 
-        # 2. Process and consolidate the DataFrame
-        df_final = _consolidate_caption_df(df_initial.copy())
+            start_strs.append(start_str)
+            end_strs.append(end_str)
+            texts.append(cleaned_text)
 
-        if df_final.empty:
+        if not texts:
             return pd.DataFrame()
 
-        # 3. Rename columns for consistency and clarity (already relative)
-        df_final = df_final.rename(
-            columns={
-                "start_time_str": "start_time",
-                "end_time_str": "end_time",
-                "start_seconds": "offset_start_seconds",
-                "end_seconds": "offset_end_seconds",
-            }
+        # 2. Convert all timestamps to seconds in one vectorized pass
+        start_secs = _timestamps_to_seconds(start_strs)
+        end_secs = _timestamps_to_seconds(end_strs)
+
+        # 3. Consolidate the cues into the final DataFrame (timestamps already relative)
+        df_final = _consolidate_captions(
+            start_strs, end_strs, start_secs, end_secs, texts
         )
 
         print(
             f"Successfully parsed and consolidated VTT into a DataFrame with {len(df_final)} rows."
         )
-        return df_final[
-            [
-                "start_time",
-                "end_time",
-                "offset_start_seconds",
-                "offset_end_seconds",
-                "text",
-            ]
-        ]
+        return df_final
 
     except Exception as e:
         print(f"An error occurred while parsing transcript file {filepath}: {e}")
         return pd.DataFrame()
 
 
-def parse_live_chat_json(filepath: str) -> pd.DataFrame:
+def _parse_live_chat_range(filepath, start=0, end=None):
     """
-    Parses a .live_chat.json file using official video offsets.
+    Extracts chat columns from the lines of a .live_chat.json file that begin
+    within the byte range [start, end).
     """
-    print(f"Parsing live chat JSON: {filepath}")
-    try:
-        chat_records = []
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    obj = json.loads(line)
-
-                    # 1. Extract Official Video Offset
-                    replay_action = obj.get("replayChatItemAction", {})
-                    video_offset_msec = replay_action.get("videoOffsetTimeMsec")
-
-                    # Skip messages without an official video timestamp (helps remove some artifacts)
-                    if not video_offset_msec:
-                        continue
+    # One list per output column, filled in step and turned into a DataFrame once
+    offsets, author_names, messages = [], [], []
+    superchat_flags, superchat_amounts = [], []
+    # Read raw bytes; both orjson and json accept them and skip the text decode layer
+    with open(filepath, "rb", buffering=1 << 20) as f:
+        position = start
+        if start:
+            # Resume at the first line beginning at or after `start`; the line
+            # straddling the boundary belongs to the previous range
+            f.seek(start - 1)
+            position += len(f.readline()) - 1
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            # Most replay lines are tickers, banners and other actions we ignore;
+            # a byte search is far cheaper than decoding them into dicts
+            if b"videoOffsetTimeMsec" not in line or not (
+                b"liveChatTextMessageRenderer" in line
+                or b"liveChatPaidMessageRenderer" in line
+                or b"liveChatPaidStickerRenderer" in line
+            ):
+                continue
+            try:
+                obj = _json_loads(line)
 
-                    # Calculate seconds immediately
-                    offset_seconds = int(video_offset_msec) / 1000.0
+                # 1. Extract Official Video Offset
+                replay_action = obj.get("replayChatItemAction")
+                if not replay_action:
+                    continue
+                video_offset_msec = replay_action.get("videoOffsetTimeMsec")
 
-                    # Handle Actions
-                    actions = replay_action.get("actions", [])
-                    for action in actions:
-                        item = action.get("addChatItemAction", {}).get("item", {})
+                # Skip messages without an official video timestamp (helps remove some artifacts)
+                if not video_offset_msec:
+                    continue
 
-                        msg_renderer = item.get("liveChatTextMessageRenderer")
-                        paid_renderer = item.get("liveChatPaidMessageRenderer")
-                        sticker_renderer = item.get("liveChatPaidStickerRenderer")
+                # Calculate seconds immediately
+                offset_seconds = int(video_offset_msec) / 1000.0
 
-                        renderer = msg_renderer or paid_renderer or sticker_renderer
-                        if not renderer:
-                            continue
+                # Handle Actions
+                for action in replay_action.get("actions", ()):
+                    add_action = action.get("addChatItemAction")
+                    if not add_action:
+                        continue
+                    item = add_action.get("item")
+                    if not item:
+                        continue
 
-                        author_name = renderer.get("authorName", {}).get(
-                            "simpleText", "Unknown"
+                    msg_renderer = item.get("liveChatTextMessageRenderer")
+                    if msg_renderer:
+                        renderer = msg_renderer
+                        paid_renderer = sticker_renderer = None
+                    else:
+                        paid_renderer = item.get("liveChatPaidMessageRenderer")
+                        sticker_renderer = (
+                            None
+                            if paid_renderer
+                            else item.get("liveChatPaidStickerRenderer")
                         )
+                        renderer = paid_renderer or sticker_renderer
+                        if not renderer:
+                            continue
 
-                        message = ""
-                        is_superchat = False
-                        superchat_amount = None
-
-                        if msg_renderer:
-                            runs = msg_renderer.get("message", {}).get("runs", [])
-                            message = "".join(
-                                part.get("text", "") for part in runs
-                            ).strip()
-
-                        elif paid_renderer:
-                            is_superchat = True
-                            superchat_amount = paid_renderer.get(
-                                "purchaseAmountText", {}
-                            ).get("simpleText")
-                            runs = paid_renderer.get("message", {}).get("runs", [])
-                            message = "".join(
-                                part.get("text", "") for part in runs
-                            ).strip()
-
-                        elif sticker_renderer:
-                            is_superchat = True
-                            superchat_amount = sticker_renderer.get(
-                                "purchaseAmountText", {}
-                            ).get("simpleText")
-                            message = "[SUPERCHAT STICKER]"
-
-                        if message:
-                            chat_records.append(
-                                {
-                                    "offset_seconds": offset_seconds,
-                                    "author_name": author_name,
-                                    "message": message,
-                                    "is_superchat": is_superchat,
-                                    "superchat_amount": superchat_amount,
-                                }
-                            )
-
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-
-        if not chat_records:
-            return pd.DataFrame()
-
-        df_chat = pd.DataFrame(chat_records)
-        # Ensure we sort by the official video offset
-        df_chat = df_chat.sort_values("offset_seconds").reset_index(drop=True)
+                    author = renderer.get("authorName")
+                    author_name = (
+                        author.get("simpleText", "Unknown") if author else "Unknown"
+                    )
+
+                    message = ""
+                    is_superchat = False
+                    superchat_amount = None
+
+                    if msg_renderer:
+                        runs = msg_renderer.get("message", {}).get("runs", ())
+                        message = _join_message_runs(runs)
+
+                    elif paid_renderer:
+                        is_superchat = True
+                        superchat_amount = paid_renderer.get(
+                            "purchaseAmountText", {}
+                        ).get("simpleText")
+                        runs = paid_renderer.get("message", {}).get("runs", ())
+                        message = _join_message_runs(runs)
+
+                    else:
+                        is_superchat = True
+                        superchat_amount = sticker_renderer.get(
+                            "purchaseAmountText", {}
+                        ).get("simpleText")
+                        message = "[SUPERCHAT STICKER]"
+
+                    if message:
+                        offsets.append(offset_seconds)
+                        author_names.append(author_name)
+                        messages.append(message)
+                        superchat_flags.append(is_superchat)
+                        superchat_amounts.append(superchat_amount)
+
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            except (json.JSONDecodeError, AttributeError):
+                continue
 
-        # 2. Filter out negative offsets (Pre-stream / Waiting room)
-        # Sometimes official offsets are negative if the user chatted before the recording started
-        df_chat = df_chat[df_chat["offset_seconds"] >= 0].copy()
+    return offsets, author_names, messages, superchat_flags, superchat_amounts
 
-        if not df_chat.empty:
-            df_chat["minute"] = (df_chat["offset_seconds"] // 60).astype(int)
 
-            # Create human readable timestamp
-            df_chat["offset_text"] = [
-                str(datetime.timedelta(seconds=int(s)))
-                for s in df_chat["offset_seconds"]
-            ]
+@_with_parquet_cache
+def parse_live_chat_json(filepath: str) -> pd.DataFrame:
+    """
+    Parses a .live_chat.json file using official video offsets.
 
-        if not chat_records:
-            return pd.DataFrame()
+    Args:
+        filepath (str): Path to the .live_chat.json file.
+        use_cache (bool): Reuse a Parquet copy of the result saved next to the
+                          file, refreshing it when the file changes.
 
-        if not chat_records:
+    Returns:
+        pd.DataFrame: DataFrame containing chat messages with video offsets.
+                      Returns an empty DataFrame if parsing fails.
+    """
+    print(f"Parsing live chat JSON: {filepath}")
+    try:
+        file_size = os.path.getsize(filepath)
+        workers = min(os.cpu_count() or 1, file_size // _PARALLEL_CHAT_MIN_BYTES)
+        if workers > 1:
+            # Long replays are bound by JSON decoding: parse newline-aligned byte
+            # ranges in separate processes and join the columns in file order
+            bounds = [file_size * i // workers for i in range(workers + 1)]
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = list(
+                    pool.map(
+                        _parse_live_chat_range,
+                        itertools.repeat(filepath, workers),
+                        bounds[:-1],
+                        bounds[1:],
+                    )
+                )
+            offsets, author_names, messages, superchat_flags, superchat_amounts = (
+                list(itertools.chain.from_iterable(column)) for column in zip(*chunks)
+            )
+        else:
+            (
+                offsets,
+                author_names,
+                messages,
+                superchat_flags,
+                superchat_amounts,
+            ) = _parse_live_chat_range(filepath)
+
+        if not messages:
             return pd.DataFrame()
 
-        df_chat = pd.DataFrame(chat_records)
-
-        # Sort by timestamp
+        chat_columns = {
+            "offset_seconds": offsets,
+            "author_name": author_names,
+            "message": messages,
+            "is_superchat": superchat_flags,
+            "superchat_amount": superchat_amounts,
+        }
+        df_chat = pd.DataFrame(chat_columns).astype(_YOUTUBE_CHAT_STRING_COLUMNS)
+        # Ensure we sort by the official video offset
         df_chat = df_chat.sort_values("offset_seconds").reset_index(drop=True)
 
-        # Filter out negative offsets (pre-stream messages)
-        df_chat = df_chat[df_chat["offset_seconds"] >= 0].copy()
+        # 2. Filter out negative offsets (Pre-stream / Waiting room)
+        # Sometimes official offsets are negative if the user chatted before the recording started
+        # Most files have none; only then is the frame filtered (and copied)
+        non_negative = df_chat["offset_seconds"].to_numpy() >= 0
+        if not non_negative.all():
+            df_chat = df_chat[non_negative].copy()
 
         if not df_chat.empty:
-            # Add minute bucket
             df_chat["minute"] = (df_chat["offset_seconds"] // 60).astype(int)
 
             # Create human readable timestamp
-            df_chat["offset_text"] = [
-                str(datetime.timedelta(seconds=int(s)))
-                for s in df_chat["offset_seconds"]
-            ]
+            df_chat["offset_text"] = _format_offset_text(df_chat["offset_seconds"])
 
             # Reorder columns to match YouTube format
             df_chat = df_chat[
@@ -333,7 +580,7 @@ def parse_live_chat_json(filepath: str) -> pd.DataFrame:
                 ]
             ]
 
-        print(f"Parsed {len(df_chat)} Twitch chat messages.")
+        print(f"Parsed {len(df_chat)} live chat messages.")
         # Ensure we return a DataFrame
         if isinstance(df_chat, pd.DataFrame):
             return df_chat
@@ -341,16 +588,19 @@ def parse_live_chat_json(filepath: str) -> pd.DataFrame:
             return pd.DataFrame(df_chat)
 
     except Exception as e:
-        print(f"Error parsing Twitch chat {filepath}: {e}")
+        print(f"Error parsing live chat {filepath}: {e}")
         return pd.DataFrame()
 
 
+@_with_parquet_cache
 def parse_twitch_chat_json(filepath: str) -> pd.DataFrame:
     """
     Parses a Twitch chat JSON file and returns a DataFrame with chat messages.
 
     Args:
         filepath (str): Path to the Twitch chat JSON file.
+        use_cache (bool): Reuse a Parquet copy of the result saved next to the
+                          file, refreshing it when the file changes.
 
     Returns:
         pd.DataFrame: DataFrame containing chat messages with timestamps.
@@ -358,15 +608,19 @@ def parse_twitch_chat_json(filepath: str) -> pd.DataFrame:
     """
     print(f"Parsing Twitch chat JSON: {filepath}")
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # The export is one JSON document: read it in a single call and hand the
+        # raw bytes to the decoder instead of streaming them through a text wrapper
+        with open(filepath, "rb") as f:
+            data = _json_loads(f.read())
 
         comments = data.get("comments", [])
         if not comments:
             print("No comments found in Twitch chat JSON file.")
             return pd.DataFrame()
 
-        chat_records = []
+        # One list per output column, filled in step and turned into a DataFrame once
+        offsets, author_names, messages = [], [], []
+        bits_spent_values, user_colors, created_ats = [], [], []
         for comment in comments:
             try:
                 # Extract required fields
@@ -384,44 +638,50 @@ def parse_twitch_chat_json(filepath: str) -> pd.DataFrame:
                 created_at = comment.get("created_at")
 
                 # Skip empty messages
-                if not message or not message.strip():
+                if not message:
+                    continue
+                message = message.strip()
+                if not message:
                     continue
 
-                chat_records.append(
-                    {
-                        "offset_seconds": offset_seconds,
-                        "author_name": author_name,
-                        "message": message.strip(),
-                        "bits_spent": bits_spent,
-                        "user_color": user_color,
-                        "created_at": created_at,
-                    }
-                )
+                offsets.append(offset_seconds)
+                author_names.append(author_name)
+                messages.append(message)
+                bits_spent_values.append(bits_spent)
+                user_colors.append(user_color)
+                created_ats.append(created_at)
 
             except (AttributeError, TypeError):
                 # Skip malformed comments
                 continue
 
-        if not chat_records:
+        if not messages:
             return pd.DataFrame()
 
-        df_chat = pd.DataFrame(chat_records)
+        chat_columns = {
+            "offset_seconds": offsets,
+            "author_name": author_names,
+            "message": messages,
+            "bits_spent": bits_spent_values,
+            "user_color": user_colors,
+            "created_at": created_ats,
+        }
+        df_chat = pd.DataFrame(chat_columns).astype(_TWITCH_CHAT_STRING_COLUMNS)
 
         # Sort by timestamp
         df_chat = df_chat.sort_values("offset_seconds").reset_index(drop=True)
 
-        # Filter out negative offsets (pre-stream messages)
-        df_chat = df_chat[df_chat["offset_seconds"] >= 0].copy()
+        # Filter out negative offsets (pre-stream messages); most files have none
+        non_negative = df_chat["offset_seconds"].to_numpy() >= 0
+        if not non_negative.all():
+            df_chat = df_chat[non_negative].copy()
 
         if not df_chat.empty:
             # Add minute bucket
             df_chat["minute"] = (df_chat["offset_seconds"] // 60).astype(int)
 
             # Create human readable timestamp
-            df_chat["offset_text"] = [
-                str(datetime.timedelta(seconds=int(s)))
-                for s in df_chat["offset_seconds"]
-            ]
+            df_chat["offset_text"] = _format_offset_text(df_chat["offset_seconds"])
 
         # Reorder columns for consistency with YouTube parser
         column_order = [
@@ -436,7 +696,8 @@ def parse_twitch_chat_json(filepath: str) -> pd.DataFrame:
         ]
         # Only include columns that exist in the DataFrame
         existing_columns = [col for col in column_order if col in df_chat.columns]
-        df_chat = df_chat[existing_columns].copy()
+        # Selecting a column list already returns a new frame
+        df_chat = df_chat[existing_columns]
 
         print(f"Parsed {len(df_chat)} Twitch chat messages.")
         # Ensure we return a DataFrame
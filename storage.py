@@ -9,6 +9,8 @@ import json
 import datetime
 import pandas as pd
 
+from config import PARQUET_COMPRESSION
+
 # --- Configuration ---
 PROCESSED_VIDEOS_FILE = 'processed_videos.txt'
 DATA_DIR = 'data'
@@ -73,7 +75,7 @@ def save_data(video_id, video_title, data_type, df):
     parquet_filepath = os.path.join(video_dir_path, parquet_filename)
     
     try:
-        df.to_parquet(parquet_filepath, index=False)
+        df.to_parquet(parquet_filepath, index=False, compression=PARQUET_COMPRESSION)
         print(f"Successfully saved {data_type} DataFrame to: {parquet_filepath}")
     except Exception as e:
         print(f"Error saving DataFrame to {parquet_filepath}: {e}")
@@ -33,6 +33,17 @@ A short line.
 Another fragment.
 """
 
+# Cue variants: header metadata, NOTE/STYLE blocks, identifiers, cue settings,
+# timestamps without hours and CRLF line endings
+VTT_VARIANTS_FIXTURE = (
+    "WEBVTT\r\nKind: captions\r\nLanguage: en\r\n\r\n"
+    "STYLE\r\n::cue { color: white }\r\n\r\n"
+    "NOTE generated for tests\r\n\r\n"
+    "cue-1\r\n00:01.000 --> 00:03.250 align:start position:0%\r\n"
+    "<c.colorE5E5E5>First cue</c>\r\n\r\n"
+    "01:00:05.000 --> 01:00:07.000\r\nSecond cue here now\r\n"
+)
+
 # Simplified live chat JSON fixture matching yt-dlp output format
 CHAT_FIXTURE_LINE1 = '{"replayChatItemAction":{"videoOffsetTimeMsec":"2000","actions":[{"addChatItemAction":{"item":{"liveChatTextMessageRenderer":{"authorName":{"simpleText":"User1"},"message":{"runs":[{"text":"First message!"}]},"timestampUsec":"2000000"}}}}]}}'
 CHAT_FIXTURE_LINE2 = '{"replayChatItemAction":{"videoOffsetTimeMsec":"5000","actions":[{"addChatItemAction":{"item":{"liveChatTextMessageRenderer":{"authorName":{"simpleText":"User2"},"message":{"runs":[{"text":"Hello world"}]},"timestampUsec":"5000000"}}}}]}}'
@@ -67,6 +78,27 @@ class TestParsers(unittest.TestCase):
         )
         self.assertEqual(first_row["offset_start_seconds"], 1.0)
 
+    def test_parse_transcript_vtt_cue_variants(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, encoding="utf-8", suffix=".vtt", newline=""
+        ) as tmp:
+            tmp.write(VTT_VARIANTS_FIXTURE)
+            tmp_path = tmp.name
+
+        result_df = parsers.parse_transcript_vtt(tmp_path)
+        os.remove(tmp_path)
+
+        self.assertEqual(
+            result_df["text"].tolist(), ["First cue", "Second cue here now"]
+        )
+        self.assertEqual(
+            result_df["start_time"].tolist(), ["00:00:01.000", "01:00:05.000"]
+        )
+        self.assertEqual(
+            result_df["end_time"].tolist(), ["00:00:03.250", "01:00:07.000"]
+        )
+        self.assertEqual(result_df["offset_start_seconds"].tolist(), [1, 3605])
+
     # Check that [Music] was filtered out
     # Note: Skipping this check due to pandas type checking issues in test environment
     # The actual parser functionality is tested implicitly by the row count check
@@ -118,6 +150,78 @@ class TestParsers(unittest.TestCase):
         self.assertEqual(superchat_row["message"], "Super chat!")
         self.assertEqual(superchat_row["superchat_amount"], "$5.00")
 
+    def test_parse_live_chat_json_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chat_path = os.path.join(tmp_dir, "video.live_chat.json")
+            with open(chat_path, "w", encoding="utf-8") as f:
+                f.write(CHAT_FIXTURE_LINE1 + "\n" + CHAT_FIXTURE_LINE3)
+
+            parsed_df = parsers.parse_live_chat_json(chat_path, use_cache=True)
+            cache_path = parsers._parquet_cache_path(chat_path)
+            self.assertTrue(os.path.exists(cache_path))
+
+            cached_df = parsers.parse_live_chat_json(chat_path, use_cache=True)
+            pd.testing.assert_frame_equal(parsed_df, cached_df)
+
+            # A corrupt cache falls back to parsing the source and is rewritten
+            with open(cache_path, "wb") as f:
+                f.write(b"not parquet")
+            recovered_df = parsers.parse_live_chat_json(chat_path, use_cache=True)
+            pd.testing.assert_frame_equal(parsed_df, recovered_df)
+            reloaded_df = parsers.parse_live_chat_json(chat_path, use_cache=True)
+            pd.testing.assert_frame_equal(parsed_df, reloaded_df)
+
+    def test_parse_live_chat_range_splits(self):
+        chat_lines = "\n".join(
+            [
+                CHAT_FIXTURE_LINE1,
+                CHAT_FIXTURE_LINE2,
+                CHAT_FIXTURE_LINE3,
+                CHAT_FIXTURE_LINE4,
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chat_path = os.path.join(tmp_dir, "video.live_chat.json")
+            for content in (chat_lines, chat_lines + "\n"):
+                with open(chat_path, "w", encoding="utf-8", newline="") as f:
+                    f.write(content)
+                full_columns = parsers._parse_live_chat_range(chat_path)
+                self.assertEqual(len(full_columns[2]), 4)
+
+                # Every line must land in exactly one of the two ranges
+                for split in range(os.path.getsize(chat_path) + 1):
+                    head = parsers._parse_live_chat_range(chat_path, 0, split)
+                    tail = parsers._parse_live_chat_range(chat_path, split)
+                    chained = tuple(h + t for h, t in zip(head, tail))
+                    self.assertEqual(chained, full_columns, f"split at byte {split}")
+
+    def test_parse_live_chat_json_parallel(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chat_path = os.path.join(tmp_dir, "video.live_chat.json")
+            with open(chat_path, "w", encoding="utf-8") as f:
+                f.write(
+                    "\n".join(
+                        [
+                            CHAT_FIXTURE_LINE1,
+                            CHAT_FIXTURE_LINE2,
+                            CHAT_FIXTURE_LINE3,
+                            CHAT_FIXTURE_LINE4,
+                        ]
+                    )
+                )
+
+            serial_df = parsers.parse_live_chat_json(chat_path)
+            with patch("parsers._PARALLEL_CHAT_MIN_BYTES", 1), patch(
+                "os.cpu_count", return_value=3
+            ), patch(
+                "concurrent.futures.ProcessPoolExecutor",
+                wraps=parsers.concurrent.futures.ProcessPoolExecutor,
+            ) as mock_pool:
+                parallel_df = parsers.parse_live_chat_json(chat_path)
+
+            mock_pool.assert_called_once_with(max_workers=3)
+            pd.testing.assert_frame_equal(serial_df, parallel_df)
+
 
 class TestStorage(unittest.TestCase):
     @patch("pandas.DataFrame.to_parquet")
@@ -161,7 +161,7 @@ def download_live_chat(video_id, output_dir=None):
     return None
 
 
-def normalize_for_resolve(input_path):
+def normalize_for_resolve(input_path, threads=None):
     output_path = input_path.replace(".mp4", "_resolve.mp4")
 
     command = [
@@ -180,12 +180,15 @@ def normalize_for_resolve(input_path):
         "-movflags", "+faststart",
         output_path,
     ]
+    if threads:
+        # Cap encoder threads so several clips can be normalized side by side
+        command[-1:-1] = ["-threads", str(threads)]
 
     subprocess.run(command, check=True)
     return output_path
 
 
-def download_video(video_id, output_dir, download_sections=None, video_name=None):
+def download_video(video_id, output_dir, download_sections=None, video_name=None, ffmpeg_threads=None):
     """
     Downloads a YouTube video to the specified output directory.
 
@@ -195,6 +198,8 @@ def download_video(video_id, output_dir, download_sections=None, video_name=None
         download_sections (list, optional): List of time sections to download
                                            in format [(start_time, end_time), ...]
                                            Times should be in HH:MM:SS format
+        ffmpeg_threads (int, optional): Thread cap for the ffmpeg re-encode of
+                                        section downloads. Defaults to ffmpeg's own choice.
 
     Returns:
         str: Path to the downloaded video file, or None if it fails
@@ -245,7 +250,7 @@ def download_video(video_id, output_dir, download_sections=None, video_name=None
         if os.path.exists(video_file):
             print(f"Video downloaded to: {video_file}")
             if download_sections:
-                video_file = normalize_for_resolve(video_file)
+                video_file = normalize_for_resolve(video_file, threads=ffmpeg_threads)
             return video_file
 
     print(f"Video download failed for video ID: {video_id}")